@@ -87,7 +87,7 @@ Point = namedtuple('Point', ['x', 'y'])
 
 
 # Dataclass
-@dataclass
+@dataclass(slots=True)
 class Person:
     name: str
     age: int
@@ -115,6 +115,8 @@ class Comparable(Protocol):
 
 # Abstract base class
 class Shape(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def area(self) -> float:
         pass
@@ -128,6 +130,8 @@ class Shape(ABC):
 
 
 class Rectangle(Shape):
+    __slots__ = ('_width', '_height')
+
     def __init__(self, width: float, height: float) -> None:
         self._width = width
         self._height = height
@@ -150,6 +154,8 @@ class Rectangle(Shape):
 
 
 class Circle(Shape):
+    __slots__ = ('radius',)
+
     def __init__(self, radius: float) -> None:
         self.radius = radius
 
@@ -162,6 +168,8 @@ class Circle(Shape):
 
 # Generic class
 class Container(Generic[T]):
+    __slots__ = ('_items',)
+
     def __init__(self) -> None:
         self._items: List[T] = []
 
@@ -226,12 +234,22 @@ def process(value: Union[str, int, list]) -> Union[str, int, list]:
         return list(reversed(value))
 
 
+# Recursive fast doubling: returns (F(n), F(n + 1)) in O(log n) calls
+def _fib_pair(n: int) -> Tuple[int, int]:
+    if n == 0:
+        return 0, 1
+    a, b = _fib_pair(n >> 1)
+    c = a * (2 * b - a)  # F(2k)
+    d = a * a + b * b    # F(2k + 1)
+    return (d, c + d) if n & 1 else (c, d)
+
+
 # Cached function
-@lru_cache(maxsize=128)
+@lru_cache(maxsize=None)
 def fibonacci(n: int) -> int:
     if n < 2:
         return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
+    return _fib_pair(n)[0]
 
 
 # Generator function
@@ -249,10 +267,14 @@ async def fetch_data(url: str) -> dict:
 
 
 async def main() -> None:
-    tasks = [fetch_data(f"https://api.example.com/{i}") for i in range(5)]
-    results = await asyncio.gather(*tasks)
-    for result in results:
-        print(result)
+    # Task groups (Python 3.11+)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [
+            tg.create_task(fetch_data(f"https://api.example.com/{i}"))
+            for i in range(5)
+        ]
+    for task in tasks:
+        print(task.result())
 
 
 # Context manager